@@ -16,6 +16,12 @@ DB_CONFIG = {
 BASE_URL = "https://dogemanga.com"
 MAX_RETRIES = 3
 MAX_THREADS = 5
+PAGE_SIZE = 20  # 漫画库每页显示数量
+
+# 连接池配置：章节并发 × 每章图片并发，保证每个工作线程都有可复用的长连接
+POOL_MAXSIZE = MAX_THREADS * MAX_THREADS
+POOL_CONNECTIONS = 10  # 缓存连接池的主机数
+USE_HTTP2 = False  # 启用 HTTP/2 多路复用（需要安装 httpx[http2]）
 
 # 获取当前脚本所在的绝对路径
 BASE_DIR = os.path.normpath(os.path.dirname(os.path.abspath(__file__)))
@@ -23,6 +29,7 @@ BASE_DIR = os.path.normpath(os.path.dirname(os.path.abspath(__file__)))
 # 规范化存储路径
 STORAGE_PATH = os.path.normpath(os.path.join(BASE_DIR, "storage"))
 OUTPUT_DIR = os.path.normpath(os.path.join(BASE_DIR, "manga_library"))
+THUMBNAIL_DIR = os.path.normpath(os.path.join(BASE_DIR, "cache", "thumbnails"))
 
 # 请求头配置
 HEADERS = {
@@ -34,6 +41,11 @@ HEADERS = {
 # 确保必要的目录存在
 os.makedirs(STORAGE_PATH, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
+os.makedirs(THUMBNAIL_DIR, exist_ok=True)
 
 # 图片格式配置
-IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".bmp", ".tiff"] 
\ No newline at end of file
+IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".bmp", ".tiff"]
+
+# 封面缩略图配置
+THUMBNAIL_SIZE = (24, 32)  # 终端预览尺寸（宽，高）
+THUMBNAIL_CACHE_SIZE = 200  # 缓存缩略图数量上限，超出按最近最少使用淘汰 
\ No newline at end of file
@@ -6,38 +6,22 @@ import urllib.parse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Optional
 
-import cloudscraper
 import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
-from config import BASE_URL, STORAGE_PATH, HEADERS, MAX_RETRIES, MAX_THREADS
+from config import BASE_URL, STORAGE_PATH, MAX_RETRIES, MAX_THREADS
+from transport import Response, Transport
 
 class MangaCrawler:
     def __init__(self):
-        self.session = self._create_session()
-        self.scraper = cloudscraper.create_scraper(
-            browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False}
-        )
-
-    def _create_session(self) -> requests.Session:
-        """创建请求会话"""
-        session = requests.Session()
-        retry = Retry(total=MAX_RETRIES, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504, 429])
-        session.mount("http://", HTTPAdapter(max_retries=retry))
-        session.mount("https://", HTTPAdapter(max_retries=retry))
-        return session
+        self.transport = Transport()
 
-    def _make_request(self, url: str, headers: dict = None) -> requests.Response:
+    def _make_request(self, url: str, headers: dict = None) -> Response:
         """发送HTTP请求"""
-        headers = headers or HEADERS
         for _ in range(MAX_RETRIES):
             try:
-                response = self.session.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
-                return response
+                return self.transport.get(url, headers=headers, timeout=30)
             except requests.RequestException as e:
                 if _ == MAX_RETRIES - 1:
                     raise Exception(f"请求失败 {url}: {str(e)}")
@@ -59,17 +43,9 @@ class MangaCrawler:
 
         for _ in range(MAX_RETRIES):
             try:
-                response = self.scraper.get(
-                    img_url,
-                    headers={**HEADERS, "referer": referer},
-                    stream=True,
-                    timeout=30
-                )
-                response.raise_for_status()
-
                 temp_path = f"{img_path}.tmp"
                 with open(temp_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                    for chunk in self.transport.iter_content(img_url, headers={"referer": referer}, timeout=30):
                         if chunk:
                             f.write(chunk)
 
@@ -163,13 +139,21 @@ class MangaCrawler:
                     except Exception as e:
                         print(f"\n章节 {chapter_title} 下载失败: {e}")
 
+        stats = self.connection_stats()
+        print(
+            f"连接复用（HTTP/1.1）: 请求 {stats['pool_requests']} 次，新建连接 {stats['connections']} 个，"
+            f"复用 {stats['reused']} 次；HTTP/2 请求 {stats['http2_requests']} 次，Cloudflare 质询 {stats['challenges']} 次"
+        )
+
+    def connection_stats(self) -> Dict[str, int]:
+        """获取连接复用统计"""
+        return self.transport.stats()
+
     def __del__(self):
         """确保资源被释放"""
         try:
-            if hasattr(self, 'session'):
-                self.session.close()
-            if hasattr(self, 'scraper'):
-                self.scraper.close()
+            if hasattr(self, 'transport'):
+                self.transport.close()
         except Exception:
             pass
 
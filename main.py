@@ -5,7 +5,7 @@ from util import *
 from __init__ import *
 import sys
 import signal
-from typing import NoReturn
+from typing import NoReturn, Sequence, Union
 
 def signal_handler(signum, frame) -> NoReturn:
     """处理 Ctrl+C 信号"""
@@ -29,11 +29,28 @@ def open_pdf(pdf_name: str, pdf_path: str = "manga_library") -> None:
     except Exception as e:
         print(f"无法打开文件：{e}")
 
-def get_user_selection(prompt: str, min_value: int, max_value: int) -> int:
+def show_cover(pdf_name: str, pdf_path: str) -> None:
+    """显示封面预览，失败时不影响打开漫画"""
+    thumb_path = get_cover_thumbnail(pdf_name, pdf_path)
+    if not thumb_path:
+        return
+    try:
+        console.print(render_thumbnail(thumb_path))
+    except Exception as e:
+        print(f"封面预览失败：{e}")
+        # 删除损坏的缓存，下次重新生成
+        try:
+            os.remove(thumb_path)
+        except OSError:
+            pass
+
+def get_user_selection(prompt: str, min_value: int, max_value: int, commands: Sequence[str] = ()) -> Union[int, str]:
     while True:
-        user_input = input(prompt)
+        user_input = input(prompt).strip()
         if user_input.lower() in ['q', 'quit']:
             return -1
+        if user_input.lower() in commands:
+            return user_input.lower()
         try:
             selection = int(user_input)
             if min_value <= selection <= max_value:
@@ -69,22 +86,53 @@ def crawler() -> None:
     save_pdf_to_database(manga_title)
 
 def manga_library() -> None:
-    pdf_files = get_pdf_files_from_database()
+    order_by = 'pdf_name'
+    pdf_files = get_pdf_page(order_by)
     if not pdf_files:
         print("当前漫画库为空，您未下载任何漫画。")
         return
 
-    print("漫画库中的 PDF 文件：")
-    for i, (title, path) in enumerate(pdf_files, start=1):
-        print(f"{i}. {title}")
+    page = 1
+    while True:
+        sort_label = "名称" if order_by == 'pdf_name' else "创建时间"
+        print(f"漫画库中的 PDF 文件（第 {page} 页，按{sort_label}排序）：")
+        for i, (_, title, _, _) in enumerate(pdf_files, start=1):
+            print(f"{i}. {title}")
+
+        user_input = get_user_selection(
+            "请选择要查看的漫画序号，'n' 下一页，'p' 上一页，'s' 切换排序，或输入 'q' 或 'quit' 退出: ",
+            1, len(pdf_files), commands=('n', 'p', 's')
+        )
+        if user_input == -1:
+            print("操作已退出。")
+            return
 
-    selected_index = get_user_selection("请选择要查看的漫画序号，或输入 'q' 或 'quit' 退出: ", 1, len(pdf_files))
-    if selected_index == -1:
-        print("操作已退出。")
-        return
+        if user_input in ['n', 'p']:
+            if user_input == 'n':
+                next_files = get_pdf_page(order_by, after=page_key(pdf_files[-1], order_by))
+            else:
+                next_files = get_pdf_page(order_by, before=page_key(pdf_files[0], order_by)) if page > 1 else []
+            if not next_files:
+                print("已经是最后一页。" if user_input == 'n' else "已经是第一页。")
+                continue
+            pdf_files = next_files
+            page += 1 if user_input == 'n' else -1
+            continue
 
-    selected_pdf_name, selected_pdf_path = pdf_files[selected_index - 1]
-    open_pdf(selected_pdf_name, selected_pdf_path)
+        if user_input == 's':
+            order_by = 'created_at' if order_by == 'pdf_name' else 'pdf_name'
+            pdf_files = get_pdf_page(order_by)
+            page = 1
+            if not pdf_files:
+                print("当前漫画库为空，您未下载任何漫画。")
+                return
+            continue
+
+        _, selected_pdf_name, selected_pdf_path, _ = pdf_files[user_input - 1]
+        if os.path.exists(selected_pdf_path):
+            show_cover(selected_pdf_name, selected_pdf_path)
+        open_pdf(selected_pdf_name, selected_pdf_path)
+        return
 
 def search_manga() -> None:
     while True:
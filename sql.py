@@ -1,6 +1,13 @@
 import mysql.connector
 from mysql.connector import Error, pooling
-from config import DB_CONFIG
+from typing import Iterator, Optional, Tuple
+from config import DB_CONFIG, PAGE_SIZE
+
+# 分页排序字段 -> 索引名
+SORT_FIELDS = {
+    'pdf_name': 'idx_pdf_name',
+    'created_at': 'idx_created_at'
+}
 
 # 全局连接池
 connection_pool = None
@@ -49,6 +56,51 @@ def execute_query(query: str, params=None, fetch=False):
         if connection:
             connection.close()
 
+def iter_query(query: str, params=None, batch_size: int = PAGE_SIZE) -> Iterator[tuple]:
+    """以服务端游标流式读取查询结果
+
+    提前结束迭代时仍会读完剩余结果才归还连接，只需部分数据请用 get_pdf_page。
+    """
+    connection = None
+    cursor = None
+    try:
+        connection = get_connection()
+        # 非缓冲游标：结果留在服务端，按批拉取
+        cursor = connection.cursor(buffered=False)
+        cursor.execute(query, params or ())
+        while rows := cursor.fetchmany(batch_size):
+            yield from rows
+
+    except Error as e:
+        print(f"数据库操作失败: {e}")
+
+    finally:
+        if cursor:
+            try:
+                # 丢弃未读取的结果，避免连接归还时报错
+                cursor.fetchall()
+            except Error:
+                pass
+            finally:
+                try:
+                    cursor.close()
+                except Error:
+                    pass
+        if connection:
+            connection.close()
+
+def ensure_indexes():
+    """确保分页排序所需的索引存在"""
+    existing = execute_query(
+        "SELECT DISTINCT index_name FROM information_schema.statistics "
+        "WHERE table_schema = %s AND table_name = 'manga_library'",
+        (DB_CONFIG['database'],), True
+    ) or []
+    existing = {name for (name,) in existing}
+    for field, index_name in SORT_FIELDS.items():
+        if index_name not in existing:
+            execute_query(f"CREATE INDEX {index_name} ON manga_library ({field}, id)")
+
 def init_database():
     """初始化数据库"""
     try:
@@ -69,9 +121,13 @@ def init_database():
                 id INT AUTO_INCREMENT PRIMARY KEY,
                 pdf_path VARCHAR(255) NOT NULL,
                 pdf_name VARCHAR(255) NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                INDEX idx_pdf_name (pdf_name, id),
+                INDEX idx_created_at (created_at, id)
             )
         """)
+        # 旧版本建的表没有索引，补建
+        ensure_indexes()
         
         # 初始化连接池
         init_pool()
@@ -99,8 +155,45 @@ def save_pdf_to_database(pdf_name: str, pdf_path: str = "manga_library/") -> Non
 
 def get_pdf_files_from_database() -> list:
     """获取所有PDF文件"""
-    result = execute_query("SELECT pdf_name, pdf_path FROM manga_library", fetch=True)
-    return result or []
+    return list(iter_pdf_files())
+
+def iter_pdf_files(order_by: str = 'pdf_name') -> Iterator[Tuple[str, str]]:
+    """流式遍历所有PDF文件"""
+    if order_by not in SORT_FIELDS:
+        raise ValueError(f"不支持的排序字段: {order_by}")
+    return iter_query(f"SELECT pdf_name, pdf_path FROM manga_library ORDER BY {order_by}, id")
+
+def get_pdf_page(order_by: str = 'pdf_name', after: Optional[tuple] = None,
+                 before: Optional[tuple] = None, page_size: int = PAGE_SIZE) -> list:
+    """键集分页获取PDF文件
+
+    after/before 为上一页末行/下一页首行的 (排序字段值, id)，返回
+    [(id, pdf_name, pdf_path, created_at), ...]，始终按升序排列。
+    """
+    if order_by not in SORT_FIELDS:
+        raise ValueError(f"不支持的排序字段: {order_by}")
+
+    query = "SELECT id, pdf_name, pdf_path, created_at FROM manga_library"
+    params = ()
+    if after is not None:
+        query += f" WHERE {order_by} > %s OR ({order_by} = %s AND id > %s)"
+        params = (after[0], after[0], after[1])
+        query += f" ORDER BY {order_by}, id LIMIT %s"
+    elif before is not None:
+        # 向前翻页：倒序取一页再翻转
+        query += f" WHERE {order_by} < %s OR ({order_by} = %s AND id < %s)"
+        params = (before[0], before[0], before[1])
+        query += f" ORDER BY {order_by} DESC, id DESC LIMIT %s"
+    else:
+        query += f" ORDER BY {order_by}, id LIMIT %s"
+
+    rows = list(iter_query(query, params + (page_size,), page_size))
+    return rows[::-1] if before is not None else rows
+
+def page_key(row: tuple, order_by: str = 'pdf_name') -> tuple:
+    """取分页行的键集游标 (排序字段值, id)"""
+    row_id, pdf_name, _, created_at = row
+    return (pdf_name if order_by == 'pdf_name' else created_at, row_id)
 
 def search_pdf_by_name(pdf_name: str, fuzzy: bool = True) -> list:
     """搜索PDF文件"""
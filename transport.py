@@ -0,0 +1,211 @@
+import threading
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Union
+
+import cloudscraper
+import requests
+from cloudscraper.exceptions import CloudflareException
+from urllib3.util.retry import Retry
+
+from config import HEADERS, MAX_RETRIES, POOL_CONNECTIONS, POOL_MAXSIZE, USE_HTTP2
+
+if TYPE_CHECKING:
+    import httpx
+
+# Cloudflare 质询常见状态码
+CHALLENGE_STATUS = (403, 429, 503)
+
+# 启用 HTTP/2 时响应来自 httpx
+Response = Union[requests.Response, "httpx.Response"]
+
+class Transport:
+    """统一的 HTTP 传输层
+
+    所有线程共用 cloudscraper 的连接池（按并发数调整大小），每个线程持有
+    自己的轻量 Session，并共享 cloudscraper 的 Cookie，从而复用 Cloudflare
+    通行凭证。遇到质询时才加锁交给 cloudscraper 处理。
+    """
+
+    def __init__(self, pool_maxsize: int = POOL_MAXSIZE, pool_connections: int = POOL_CONNECTIONS,
+                 http2: bool = USE_HTTP2):
+        self.scraper = cloudscraper.create_scraper(
+            browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False}
+        )
+        self._challenge_lock = threading.Lock()
+        # 每次 cloudscraper 成功刷新通行凭证后递增
+        self._clearance_generation = 0
+        self._local = threading.local()
+
+        # 通行凭证与 User-Agent 绑定，统一使用 cloudscraper 的 User-Agent
+        self.headers = {**HEADERS, "User-Agent": self.scraper.headers["User-Agent"]}
+
+        self._counts = {"requests": 0, "http2_requests": 0, "challenges": 0}
+        # 已被淘汰或关闭的连接池的累计数据
+        self._retired = {"connections": 0, "pool_requests": 0}
+        self._counts_lock = threading.Lock()
+
+        # 只重试连接错误：质询响应（429/503）要立即交给 cloudscraper，
+        # 5xx 由爬虫层的重试循环处理
+        template = self.scraper.adapters["https://"]
+        self.adapter = cloudscraper.CipherSuiteAdapter(
+            ssl_context=template.ssl_context,
+            source_address=getattr(template, "source_address", None),
+            server_hostname=getattr(template, "server_hostname", None),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=MAX_RETRIES, backoff_factor=0.5)
+        )
+        self._track_evictions(self.adapter)
+        template.close()
+        for prefix in ("https://", "http://"):
+            self.scraper.mount(prefix, self.adapter)
+
+        self.http2_client = self._create_http2_client(pool_maxsize) if http2 else None
+
+    def _create_http2_client(self, pool_maxsize: int):
+        """创建 HTTP/2 客户端（需要安装 httpx[http2]）"""
+        try:
+            import httpx
+            return httpx.Client(
+                http2=True,
+                headers=self.headers,
+                cookies=self.scraper.cookies,
+                limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+                timeout=30,
+                follow_redirects=True
+            )
+        except ImportError as e:
+            print(f"HTTP/2 不可用，使用 HTTP/1.1：{e}")
+            return None
+
+    def _session(self) -> requests.Session:
+        """获取当前线程的 Session，挂载共享的连接池"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.cookies = self.scraper.cookies
+            for prefix in ("https://", "http://"):
+                session.mount(prefix, self.adapter)
+            self._local.session = session
+        return session
+
+    def _track_evictions(self, adapter: requests.adapters.HTTPAdapter) -> None:
+        """连接池被淘汰时记录其计数，保证统计为累计值"""
+        pools = adapter.poolmanager.pools
+        dispose = pools.dispose_func
+
+        def retire(pool) -> None:
+            with self._counts_lock:
+                self._retired["connections"] += pool.num_connections
+                self._retired["pool_requests"] += pool.num_requests
+            if dispose:
+                dispose(pool)
+
+        pools.dispose_func = retire
+
+    def _count(self, name: str) -> None:
+        with self._counts_lock:
+            self._counts[name] += 1
+
+    @staticmethod
+    def _is_challenge(status_code: int, headers) -> bool:
+        return status_code in CHALLENGE_STATUS and headers.get("Server", "").lower().startswith("cloudflare")
+
+    def _http2_get(self, url: str, headers: Optional[dict], timeout: int) -> "httpx.Response":
+        import httpx
+        try:
+            response = self.http2_client.get(url, headers=headers, timeout=timeout)
+        except (httpx.HTTPError, httpx.InvalidURL, httpx.StreamError, httpx.CookieConflict) as e:
+            raise requests.RequestException(str(e)) from e
+        self._count("http2_requests")
+        return response
+
+    def _plain_get(self, url: str, headers: Optional[dict], stream: bool, timeout: int) -> Response:
+        """不经 cloudscraper 直接请求"""
+        if self.http2_client is not None:
+            return self._http2_get(url, headers, timeout)
+        return self._session().get(url, headers=headers, stream=stream, timeout=timeout)
+
+    @staticmethod
+    def _raise_for_status(response: Response, url: str) -> None:
+        if isinstance(response, requests.Response):
+            response.raise_for_status()
+        elif response.is_error:
+            raise requests.HTTPError(f"{response.status_code} Error for url: {url}")
+
+    def _request(self, url: str, headers: Optional[dict], stream: bool, timeout: int) -> Response:
+        """先直接请求，遇到质询再交给 cloudscraper 刷新共享的通行凭证"""
+        generation = self._clearance_generation
+        response = self._plain_get(url, headers, stream, timeout)
+        if not self._is_challenge(response.status_code, response.headers):
+            return response
+        response.close()
+
+        with self._challenge_lock:
+            if self._clearance_generation != generation:
+                # 等锁期间其他线程已刷新通行凭证，先用新凭证重试
+                response = self._plain_get(url, headers, stream, timeout)
+                if not self._is_challenge(response.status_code, response.headers):
+                    return response
+                response.close()
+
+            self._count("challenges")
+            try:
+                response = self.scraper.get(url, headers=headers, stream=stream, timeout=timeout)
+            except CloudflareException as e:
+                raise requests.RequestException(f"Cloudflare 质询失败: {e}") from e
+            if not self._is_challenge(response.status_code, response.headers):
+                self._clearance_generation += 1
+            return response
+
+    def get(self, url: str, headers: Optional[dict] = None, timeout: int = 30) -> Response:
+        """发送 GET 请求并读取完整响应"""
+        self._count("requests")
+        response = self._request(url, headers, False, timeout)
+        self._raise_for_status(response, url)
+        return response
+
+    def iter_content(self, url: str, headers: Optional[dict] = None,
+                     chunk_size: int = 8192, timeout: int = 30) -> Iterator[bytes]:
+        """流式下载，逐块返回响应内容"""
+        self._count("requests")
+        response = self._request(url, headers, True, timeout)
+        if isinstance(response, requests.Response):
+            with response:
+                response.raise_for_status()
+                yield from response.iter_content(chunk_size=chunk_size)
+        else:
+            # HTTP/2 下单连接多路复用，直接读取完整内容
+            self._raise_for_status(response, url)
+            yield response.content
+
+    def stats(self) -> Dict[str, int]:
+        """连接复用统计
+
+        connections/pool_requests/reused 仅统计 HTTP/1.1 连接池（含质询请求），
+        HTTP/2 只记录请求数。
+        """
+        with self._counts_lock:
+            counts = dict(self._counts)
+            connections = self._retired["connections"]
+            requests_sent = self._retired["pool_requests"]
+
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests_sent += pool.num_requests
+
+        return {
+            **counts,
+            "connections": connections,
+            "pool_requests": requests_sent,
+            "reused": max(requests_sent - connections, 0),
+        }
+
+    def close(self) -> None:
+        """释放连接池"""
+        if self.http2_client is not None:
+            self.http2_client.close()
+        self.scraper.close()
@@ -1,13 +1,14 @@
 import os
 import re
-from typing import List
+import hashlib
+from typing import List, Optional
 import pyfiglet
 import img2pdf
 from PIL import Image
 from rich import print
 from rich.text import Text
 from rich.console import Console
-from config import OUTPUT_DIR, STORAGE_PATH
+from config import OUTPUT_DIR, STORAGE_PATH, THUMBNAIL_DIR, THUMBNAIL_SIZE, THUMBNAIL_CACHE_SIZE
 
 IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".bmp", ".tiff"]
 
@@ -58,6 +59,92 @@ def create_pdf(manga_name: str, storage_path: str = STORAGE_PATH) -> None:
     except Exception as e:
         print(f"生成 PDF 时出错：{e}")
 
+def _first_page_from_storage(manga_name: str, storage_path: str = STORAGE_PATH) -> Optional[str]:
+    """取下载目录中第一章的第一张图片"""
+    manga_path = os.path.normpath(os.path.join(storage_path, manga_name))
+    if not os.path.isdir(manga_path):
+        return None
+    for chapter_name in sorted(os.listdir(manga_path), key=natural_sort_key):
+        chapter_path = os.path.normpath(os.path.join(manga_path, chapter_name))
+        if os.path.isdir(chapter_path):
+            for img in get_sorted_files(chapter_path):
+                if is_image(img):
+                    return img
+    return None
+
+def _first_page_from_pdf(pdf_path: str) -> Optional[Image.Image]:
+    """取PDF第一页的图片（需要安装 pypdf）"""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+    try:
+        # 传入文件句柄，pypdf 按需读取而不是整份载入内存
+        with open(pdf_path, "rb") as f:
+            images = PdfReader(f).pages[0].images
+            return images[0].image.copy() if images else None
+    except Exception:
+        return None
+
+def _evict_thumbnails(max_size: int = THUMBNAIL_CACHE_SIZE) -> None:
+    """按最近访问时间淘汰多余的缩略图"""
+    entries = [entry for entry in os.scandir(THUMBNAIL_DIR) if entry.is_file()]
+    if len(entries) <= max_size:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:len(entries) - max_size]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def get_cover_thumbnail(manga_name: str, pdf_path: Optional[str] = None) -> Optional[str]:
+    """获取封面缩略图路径，首次访问时生成"""
+    key = hashlib.md5(f"{manga_name}{THUMBNAIL_SIZE}".encode("utf-8")).hexdigest()
+    thumb_path = os.path.join(THUMBNAIL_DIR, f"{key}.png")
+    if os.path.exists(thumb_path):
+        # 命中时刷新时间戳，作为 LRU 的访问记录
+        os.utime(thumb_path)
+        return thumb_path
+
+    temp_path = f"{thumb_path}.tmp"
+    try:
+        if source := _first_page_from_storage(manga_name):
+            with Image.open(source) as img:
+                cover = img.convert("RGB")
+        elif pdf_path and (cover := _first_page_from_pdf(pdf_path)):
+            cover = cover.convert("RGB")
+        else:
+            return None
+        cover.thumbnail(THUMBNAIL_SIZE)
+        cover.save(temp_path, "PNG")
+        os.replace(temp_path, thumb_path)
+    except Exception as e:
+        print(f"生成封面缩略图失败：{e}")
+        return None
+    finally:
+        # 保存中断或失败时不留下残缺的缓存文件
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    _evict_thumbnails()
+    return thumb_path
+
+def render_thumbnail(thumb_path: str) -> Text:
+    """用半块字符在终端中渲染缩略图"""
+    preview = Text()
+    with Image.open(thumb_path) as img:
+        img = img.convert("RGB")
+        width, height = img.size
+        pixels = img.load()
+        for y in range(0, height, 2):
+            for x in range(width):
+                top = pixels[x, y]
+                bottom = pixels[x, y + 1] if y + 1 < height else (0, 0, 0)
+                preview.append("▀", style=f"#{top[0]:02x}{top[1]:02x}{top[2]:02x} on #{bottom[0]:02x}{bottom[1]:02x}{bottom[2]:02x}")
+            preview.append("\n")
+    return preview
+
 def create_ascii_art(text: str, font: str = "slant") -> Text:
     ascii_art = pyfiglet.figlet_format(text, font=font)
     gradient_text = Text()